@@ -3,11 +3,9 @@ import pandas as pd
 from datetime import datetime, timedelta
 import googleapiclient.discovery
 import googleapiclient.errors
-import google.generativeai as genai
 import os
 from googleapiclient.discovery import build
 import re
-from bs4 import BeautifulSoup
 import html
 
 # Set page config
@@ -28,6 +26,30 @@ and uses Gemini AI to suggest thematic content for lectures targeting various ag
 if 'philosophy_context' not in st.session_state:
     st.session_state['philosophy_context'] = ""
 
+# Line breaks or double spaces plus surrounding whitespace, collapsed to one newline
+# (same result as stripping each line, splitting on "  " and dropping empty chunks;
+# the class lists every line boundary str.splitlines() recognises)
+WHITESPACE_RE = re.compile(r"\s*(?:[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]|  )\s*")
+
+# Function to extract clean text from the philosophy context HTML
+@st.cache_data(show_spinner=False)
+def load_philosophy_context(content):
+    # Imported here so reruns that hit the cache never need BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    # Extract text from HTML using BeautifulSoup, parsing only the prose container.
+    # While straining, bs4 sees the raw class string ("entry clr"), so match on its tokens
+    strainer = SoupStrainer("div", class_=lambda classes: classes is not None and "entry" in classes.split())
+    soup = BeautifulSoup(content, 'lxml', parse_only=strainer)
+    
+    # Get text and clean it up in a single pass
+    cleaned_text = WHITESPACE_RE.sub("\n", soup.get_text()).strip()
+    
+    # Limit context length to avoid token limits when prompting Gemini
+    truncated_text = cleaned_text[:10000] + "..." if len(cleaned_text) > 10000 else cleaned_text
+    
+    return content, cleaned_text, truncated_text
+
 # Sidebar for API keys
 with st.sidebar:
     # Hide API Configuration for security
@@ -67,26 +89,13 @@ with st.sidebar:
 </html>
         """
         
-        # Store the raw HTML content
-        st.session_state['philosophy_context'] = content
-        
-        # Extract text from HTML using BeautifulSoup
-        soup = BeautifulSoup(content, 'html.parser')
+        # Parse once per process; reruns hit the cached result
+        raw_content, cleaned_text, truncated_text = load_philosophy_context(content)
         
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.extract()
-        
-        # Get text
-        cleaned_text = soup.get_text()
-        
-        # Clean up the text
-        lines = (line.strip() for line in cleaned_text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        cleaned_text = '\n'.join(chunk for chunk in chunks if chunk)
-        
-        # Store cleaned text
+        # Store the raw HTML content, cleaned text and prompt-sized text
+        st.session_state['philosophy_context'] = raw_content
         st.session_state['philosophy_context_cleaned'] = cleaned_text
+        st.session_state['philosophy_context_truncated'] = truncated_text
         
         # Show a sample of the extracted text
         with st.expander("Preview extracted text"):
@@ -97,6 +106,13 @@ with st.sidebar:
         
     st.caption("Note: This application requires API keys to function properly.")
 
+# Time periods as period key -> (source label, session state key)
+TIME_PERIODS = {
+    "1 week": ("Last Week", 'weekly_videos'),
+    "1 month": ("Last Month", 'monthly_videos'),
+    "6 months": ("Last 6 Months", 'biannual_videos')
+}
+
 # Function to get date in ISO format for a given period
 def get_date_for_period(period):
     today = datetime.now()
@@ -109,123 +125,234 @@ def get_date_for_period(period):
         past_date = today - timedelta(days=180)
     else:
         return None
-        
-    return past_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+    
+    # Round to the hour so repeated mines reuse the cached YouTube response
+    return past_date.strftime("%Y-%m-%dT%H:00:00Z")
 
-# Function to get popular videos from YouTube
-def get_popular_videos(api_key, query, max_results, published_after):
+# Function to get this session's YouTube client, built once and reused across reruns
+# (kept per session because the httplib2 connection inside it is not thread-safe)
+def get_youtube_client(api_key):
+    if st.session_state.get('youtube_client_key') != api_key:
+        st.session_state['youtube_client'] = build("youtube", "v3", developerKey=api_key)
+        st.session_state['youtube_client_key'] = api_key
+    return st.session_state['youtube_client']
+
+# Partial-response filters so the API only returns the fields we read
+SEARCH_FIELDS = "items/id/videoId"
+VIDEO_FIELDS = (
+    "items(id,"
+    "snippet(title,channelTitle,publishedAt,description,thumbnails/high/url),"
+    "statistics(viewCount,likeCount,commentCount))"
+)
+
+# Function to build the search request for the most viewed videos since a date
+def build_search_request(youtube, query, max_results, published_after):
+    return youtube.search().list(
+        part="id,snippet",
+        q=query,
+        type="video",
+        order="viewCount",
+        publishedAfter=published_after,
+        maxResults=max_results,
+        fields=SEARCH_FIELDS
+    )
+
+# Function to build the videos.list request for details and statistics of video IDs
+def build_videos_request(youtube, video_ids):
+    return youtube.videos().list(
+        part="snippet,statistics",
+        id=','.join(video_ids),
+        fields=VIDEO_FIELDS
+    )
+
+# Function to turn videos.list items into result dicts in search (view count) order
+def parse_video_items(items, video_ids):
+    results = [
+        {
+            'title': item['snippet']['title'],
+            'channel': item['snippet']['channelTitle'],
+            'published_at': item['snippet']['publishedAt'],
+            'view_count': int(item['statistics'].get('viewCount', 0)),
+            'like_count': int(item['statistics'].get('likeCount', 0)),
+            'comment_count': int(item['statistics'].get('commentCount', 0)),
+            'video_id': item['id'],
+            'thumbnail': item['snippet']['thumbnails']['high']['url'],
+            'description': item['snippet']['description']
+        }
+        for item in items
+    ]
+    
+    # videos.list returns items in ID order; restore the search's order="viewCount" ranking
+    rank = {video_id: i for i, video_id in enumerate(video_ids)}
+    results.sort(key=lambda x: rank[x['video_id']])
+    return results
+
+# Function to fetch popular videos from YouTube, cached per search parameters
+# (the client is excluded from the cache key by its leading underscore)
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_popular_videos(query, max_results, published_after, _youtube):
+    youtube = _youtube
+    
+    # First get video IDs from search
+    search_request = build_search_request(youtube, query, max_results, published_after)
+    search_response = search_request.execute()
+    
+    # Extract video IDs
+    video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+    
+    # Nothing to look up; videos.list would reject an empty id list
+    if not video_ids:
+        return []
+    
+    # Get detailed video statistics
+    videos_request = build_videos_request(youtube, video_ids)
+    videos_response = videos_request.execute()
+    
+    # Process and return the results
+    return parse_video_items(videos_response.get('items', []), video_ids)
+
+# Function to fetch popular videos for several periods in two batched round trips
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_popular_videos_batch(query, max_results, published_afters, _youtube):
+    youtube = _youtube
+    
+    # Collect batch responses keyed by request ID (the published_after date)
+    responses = {}
+    def store_response(request_id, response, exception):
+        if exception is not None:
+            raise exception
+        responses[request_id] = response
+    
+    # First get video IDs for every period in a single HTTP batch
+    search_batch = youtube.new_batch_http_request(callback=store_response)
+    for published_after in published_afters:
+        search_batch.add(build_search_request(youtube, query, max_results, published_after), request_id=published_after)
+    search_batch.execute()
+    
+    video_ids = {
+        published_after: [item['id']['videoId'] for item in responses[published_after].get('items', [])]
+        for published_after in published_afters
+    }
+    
+    # Then get detailed video statistics for every period in a second batch
+    responses.clear()
+    videos_batch = youtube.new_batch_http_request(callback=store_response)
+    for published_after, ids in video_ids.items():
+        if ids:
+            videos_batch.add(build_videos_request(youtube, ids), request_id=published_after)
+    if any(video_ids.values()):
+        videos_batch.execute()
+    
+    # Process and return the results per period
+    return {
+        published_after: parse_video_items(responses.get(published_after, {}).get('items', []), video_ids[published_after])
+        for published_after in published_afters
+    }
+
+# Function to get popular videos from YouTube, tagged with their time period
+def get_popular_videos(api_key, query, max_results, published_after, source):
     try:
-        youtube = build("youtube", "v3", developerKey=api_key)
-        
-        # First get video IDs from search
-        search_request = youtube.search().list(
-            part="id,snippet",
-            q=query,
-            type="video",
-            order="viewCount",
-            publishedAfter=published_after,
-            maxResults=max_results
-        )
-        search_response = search_request.execute()
-        
-        # Extract video IDs
-        video_ids = [item['id']['videoId'] for item in search_response['items']]
-        
-        # Get detailed video statistics
-        videos_request = youtube.videos().list(
-            part="snippet,statistics",
-            id=','.join(video_ids)
-        )
-        videos_response = videos_request.execute()
-        
-        # Process and return the results
-        results = []
-        for item in videos_response['items']:
-            results.append({
-                'title': item['snippet']['title'],
-                'channel': item['snippet']['channelTitle'],
-                'published_at': item['snippet']['publishedAt'],
-                'view_count': int(item['statistics'].get('viewCount', 0)),
-                'like_count': int(item['statistics'].get('likeCount', 0)),
-                'comment_count': int(item['statistics'].get('commentCount', 0)),
-                'video_id': item['id'],
-                'thumbnail': item['snippet']['thumbnails']['high']['url'],
-                'description': item['snippet']['description']
-            })
-        
-        # Sort by view count
-        results.sort(key=lambda x: x['view_count'], reverse=True)
-        return results
+        videos = fetch_popular_videos(query, max_results, published_after, get_youtube_client(api_key))
+        return [{**video, 'source': source} for video in videos]
     
     except Exception as e:
         st.error(f"Error fetching YouTube data: {str(e)}")
         return []
 
-# Function to generate brief context for each video
-def generate_video_context(title, description):
-    # Extract first 200 characters of description or less
-    brief_desc = description[:200] + "..." if len(description) > 200 else description
-    
-    # Simple rule-based contextualizing (could be replaced with more sophisticated NLP)
-    context = ""
-    
-    if re.search(r'meditation|mindfulness', title.lower() + brief_desc.lower()):
-        context = "Meditation/Mindfulness practice"
-    elif re.search(r'buddhis|zen|tao', title.lower() + brief_desc.lower()):
-        context = "Eastern philosophy"
-    elif re.search(r'christian|jesus|bible|faith', title.lower() + brief_desc.lower()):
-        context = "Christian spirituality"
-    elif re.search(r'islam|muslim|quran', title.lower() + brief_desc.lower()):
-        context = "Islamic spirituality"
-    elif re.search(r'judaism|jewish|torah', title.lower() + brief_desc.lower()):
-        context = "Jewish spirituality"
-    elif re.search(r'hindu|vedanta|yoga', title.lower() + brief_desc.lower()):
-        context = "Hindu spirituality"
-    elif re.search(r'consciousness|awareness', title.lower() + brief_desc.lower()):
-        context = "Consciousness exploration"
-    elif re.search(r'psychedelic|plant medicine|ayahuasca|dmt', title.lower() + brief_desc.lower()):
-        context = "Psychedelic spirituality"
-    elif re.search(r'near death|afterlife|heaven', title.lower() + brief_desc.lower()):
-        context = "Afterlife exploration"
-    elif re.search(r'science|physics|quantum', title.lower() + brief_desc.lower()):
-        context = "Science and spirituality"
-    else:
-        context = "General spiritual content"
-    
-    return context
-
-# Function to use Gemini to generate lecture themes
-def generate_lecture_themes(api_key, video_data, age_group):
+# Function to get popular videos from YouTube for several periods at once
+def get_popular_videos_for_periods(api_key, query, max_results, periods):
     try:
-        # Configure the Gemini API
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-pro')
-        
-        # Prepare prompt with video titles and contexts
-        titles_context = "\n".join([f"- {video['title']} ({video['context']})" for video in video_data])
-        
-        # Define age group characteristics
-        age_characteristics = {
-            "20-30": "digital natives, social media focused, seeking authenticity, concerned about climate crisis, mental health aware",
-            "30-40": "career-focused, starting families, balancing work-life, health conscious, pragmatic spirituality",
-            "40-50": "mid-life reflection, established careers, parenting teens, seeking deeper meaning, stress management",
-            "50-60": "empty nest transitions, career peak or change, caring for aging parents, legacy considerations",
-            "60+": "retirement planning/living, health challenges, grandparenting, mortality awareness, wisdom sharing"
+        published_afters = {period: get_date_for_period(period) for period in periods}
+        youtube = get_youtube_client(api_key)
+        videos_by_date = fetch_popular_videos_batch(query, max_results, tuple(published_afters.values()), youtube)
+        return {
+            period: [{**video, 'source': TIME_PERIODS[period][0]} for video in videos_by_date[published_after]]
+            for period, published_after in published_afters.items()
         }
+    
+    except Exception as e:
+        st.error(f"Error fetching YouTube data: {str(e)}")
+        return {}
+
+# Video categories as (group name, keyword pattern, label), in priority order
+VIDEO_CATEGORIES = [
+    ("meditation", r'meditation|mindfulness', "Meditation/Mindfulness practice"),
+    ("eastern", r'buddhis|zen|tao', "Eastern philosophy"),
+    ("christian", r'christian|jesus|bible|faith', "Christian spirituality"),
+    ("islamic", r'islam|muslim|quran', "Islamic spirituality"),
+    ("jewish", r'judaism|jewish|torah', "Jewish spirituality"),
+    ("hindu", r'hindu|vedanta|yoga', "Hindu spirituality"),
+    ("consciousness", r'consciousness|awareness', "Consciousness exploration"),
+    ("psychedelic", r'psychedelic|plant medicine|ayahuasca|dmt', "Psychedelic spirituality"),
+    ("afterlife", r'near death|afterlife|heaven', "Afterlife exploration"),
+    ("science", r'science|physics|quantum', "Science and spirituality"),
+]
+
+# All category patterns compiled once into a single alternation of named groups.
+# Each group sits in a lookahead so matches can overlap: an earlier low-priority
+# match must not hide a higher-priority one (e.g. "judaismuslim" is Islamic).
+# Matched against lowercased text, so no IGNORECASE is needed.
+CATEGORY_RE = re.compile(
+    "|".join(f"(?=(?P<{name}>{pattern}))" for name, pattern, _ in VIDEO_CATEGORIES)
+)
+
+# Function to pick the highest-priority category label from CATEGORY_RE findall matches
+def highest_priority_context(matches):
+    priorities = [next(i for i, group in enumerate(match) if group) for match in matches]
+    return VIDEO_CATEGORIES[min(priorities)][2] if priorities else "General spiritual content"
+
+# Function to contextualize a batch of videos with one combined-pattern scan each
+def add_video_contexts(videos):
+    # Contexts computed earlier in this session, keyed by video ID, so videos
+    # that show up in several time periods are only classified once
+    if 'video_contexts' not in st.session_state:
+        st.session_state['video_contexts'] = {}
+    known_contexts = st.session_state['video_contexts']
+    
+    new_videos = [video for video in videos if video['video_id'] not in known_contexts]
+    if new_videos:
+        df = pd.DataFrame(new_videos)
         
-        # Get philosophical context if available
-        philosophy_context = ""
-        if 'philosophy_context_cleaned' in st.session_state and st.session_state['philosophy_context_cleaned']:
-            full_context = st.session_state['philosophy_context_cleaned']
-            # Limit context length to avoid token limits
-            if len(full_context) > 10000:
-                philosophy_context = full_context[:10000] + "..."
-            else:
-                philosophy_context = full_context
+        # Classify on the title plus the first 200 characters of the description
+        haystack = (df['title'] + " " + df['description'].str[:200]).str.lower()
         
-        # Add philosophy context to the prompt if available
-        if philosophy_context:
-            prompt = f"""
+        # One scan of the combined alternation per video instead of one pass per category;
+        # findall yields a tuple of group values per match, in VIDEO_CATEGORIES order
+        matches = haystack.str.findall(CATEGORY_RE)
+        contexts = matches.map(highest_priority_context)
+        known_contexts.update(zip(df['video_id'], contexts))
+    
+    return [{**video, 'context': known_contexts[video['video_id']]} for video in videos]
+
+# Function to send a prompt to Gemini
+def generate_gemini_response(prompt, api_key):
+    # Imported on first use so sessions that only mine videos skip the Gemini SDK
+    import google.generativeai as genai
+    
+    # Configure the Gemini API
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel('gemini-pro')
+    
+    response = model.generate_content(prompt)
+    return response.text
+
+# Function to send a prompt to Gemini, reusing recent answers held in server memory
+# (the API key is excluded from the cache key by its leading underscore)
+@st.cache_data(ttl=86400, max_entries=100, show_spinner=False)
+def cached_gemini_response(prompt, _api_key):
+    return generate_gemini_response(prompt, _api_key)
+
+# Age group characteristics used to tailor the lecture theme prompt
+AGE_CHARACTERISTICS = {
+    "20-30": "digital natives, social media focused, seeking authenticity, concerned about climate crisis, mental health aware",
+    "30-40": "career-focused, starting families, balancing work-life, health conscious, pragmatic spirituality",
+    "40-50": "mid-life reflection, established careers, parenting teens, seeking deeper meaning, stress management",
+    "50-60": "empty nest transitions, career peak or change, caring for aging parents, legacy considerations",
+    "60+": "retirement planning/living, health challenges, grandparenting, mortality awareness, wisdom sharing"
+}
+
+# Prompt template used when philosophical context is available
+PROMPT_WITH_CONTEXT = """
 As a spiritual content creator for a philosophical school of thought, analyze these trending YouTube video titles related to spirituality:
 
 {titles_context}
@@ -236,7 +363,7 @@ The philosophical school has the following context, which should guide your sugg
 ----
 
 Based on these trends and the philosophical context, suggest 5 compelling lecture themes that would resonate specifically with people aged {age_group} years. 
-Consider that this age group typically has these characteristics: {age_characteristics.get(age_group, "")}.
+Consider that this age group typically has these characteristics: {age_characteristics}.
 
 Make sure your suggested themes align with the philosophical approach described in the context.
 
@@ -248,15 +375,15 @@ For each theme:
 
 Format your response as a numbered list with the title in bold, followed by the description and reasoning.
 """
-        else:
-            # Original prompt without philosophical context
-            prompt = f"""
+
+# Original prompt template without philosophical context
+PROMPT_WITHOUT_CONTEXT = """
 As a spiritual content creator, analyze these trending YouTube video titles related to spirituality:
 
 {titles_context}
 
 Based on these trends, suggest 5 compelling lecture themes that would resonate specifically with people aged {age_group} years. 
-Consider that this age group typically has these characteristics: {age_characteristics.get(age_group, "")}.
+Consider that this age group typically has these characteristics: {age_characteristics}.
 
 For each theme:
 1. Provide a catchy title
@@ -266,106 +393,111 @@ For each theme:
 Format your response as a numbered list with the title in bold, followed by the description and reasoning.
 """
 
-        # Generate the response
-        response = model.generate_content(prompt)
-        return response.text
+# Function to use Gemini to generate lecture themes
+def generate_lecture_themes(api_key, video_data, age_group, use_cache=True):
+    try:
+        # Prepare prompt with video titles and contexts
+        titles_context = "\n".join([f"- {video['title']} ({video['context']})" for video in video_data])
+        
+        # Get philosophical context if available (already truncated when loaded)
+        philosophy_context = st.session_state.get('philosophy_context_truncated', "")
+        
+        # Add philosophy context to the prompt if available
+        template = PROMPT_WITH_CONTEXT if philosophy_context else PROMPT_WITHOUT_CONTEXT
+        prompt = template.format_map({
+            'titles_context': titles_context,
+            'philosophy_context': philosophy_context,
+            'age_group': age_group,
+            'age_characteristics': AGE_CHARACTERISTICS.get(age_group, "")
+        })
+
+        # Generate the response; unless regenerating, an identical prompt reuses the cached answer
+        if use_cache:
+            return cached_gemini_response(prompt, api_key)
+        return generate_gemini_response(prompt, api_key)
     
     except Exception as e:
         return f"Error generating lecture themes: {str(e)}"
 
+# Function to display a list of mined videos
+def render_videos(videos):
+    for i, video in enumerate(videos):
+        st.write(f"**{i+1}. {video['title']}**")
+        st.write(f"*Context: {video['context']}*")
+        st.write(f"Views: {video['view_count']:,} | Channel: {video['channel']}")
+        st.write(f"[Watch on YouTube](https://www.youtube.com/watch?v={video['video_id']})")
+        # Lazy-load thumbnails so off-screen images don't block rendering
+        thumbnail_url = html.escape(video['thumbnail'], quote=True)
+        st.markdown(f'<img src="{thumbnail_url}" loading="lazy" width="100%">', unsafe_allow_html=True)
+        st.divider()
+
+# Function to render one time period's column: mine button, fetch and video list
+# (show_mined displays the videos just stored by "Mine All Periods")
+def mine_and_render_period(period, api_key, query, max_results, show_mined=False):
+    source, state_key = TIME_PERIODS[period]
+    possessive = source + ("'" if source.endswith("s") else "'s")
+    
+    st.subheader(source)
+    if st.button(f"Mine {possessive} Videos"):
+        if api_key:
+            with st.spinner(f"Fetching {possessive.lower()} popular videos..."):
+                published_after = get_date_for_period(period)
+                videos = get_popular_videos(api_key, query, max_results, published_after, source)
+                
+                if videos:
+                    # Add context to all videos in one vectorized pass
+                    videos = add_video_contexts(videos)
+                    
+                    # Store in session state for later use
+                    st.session_state[state_key] = videos
+                    
+                    # Display videos
+                    render_videos(videos)
+                else:
+                    st.warning("No videos found or error occurred.")
+        else:
+            st.error("Please enter your YouTube API key in the sidebar.")
+    elif show_mined:
+        videos = st.session_state.get(state_key, [])
+        if videos:
+            render_videos(videos)
+        else:
+            st.warning("No videos found for this period.")
+
 # Main app layout
 tab1, tab2, tab3 = st.tabs(["Mine YouTube Videos", "Lecture Theme Generator", "About"])
 
 with tab1:
     st.header("Mine Popular Spirituality Videos")
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.subheader("Last Week")
-        if st.button("Mine Last Week's Videos"):
-            if youtube_api_key:
-                with st.spinner("Fetching last week's popular videos..."):
-                    published_after = get_date_for_period("1 week")
-                    videos = get_popular_videos(youtube_api_key, search_query, max_results, published_after)
+    # Mine every time period at once using batched YouTube requests
+    mined_all = False
+    if st.button("Mine All Periods"):
+        if youtube_api_key:
+            with st.spinner("Fetching popular videos for all time periods..."):
+                videos_by_period = get_popular_videos_for_periods(youtube_api_key, search_query, max_results, list(TIME_PERIODS))
+                
+                if any(videos_by_period.values()):
+                    # Add context and store each period in session state for later use
+                    for period, (_, state_key) in TIME_PERIODS.items():
+                        videos = videos_by_period.get(period, [])
+                        st.session_state[state_key] = add_video_contexts(videos) if videos else []
+                    mined_all = True
                     
-                    if videos:
-                        # Add context to each video
-                        for video in videos:
-                            video['context'] = generate_video_context(video['title'], video['description'])
-                        
-                        # Store in session state for later use
-                        st.session_state['weekly_videos'] = videos
-                        
-                        # Display videos
-                        for i, video in enumerate(videos):
-                            st.write(f"**{i+1}. {video['title']}**")
-                            st.write(f"*Context: {video['context']}*")
-                            st.write(f"Views: {video['view_count']:,} | Channel: {video['channel']}")
-                            st.write(f"[Watch on YouTube](https://www.youtube.com/watch?v={video['video_id']})")
-                            st.image(video['thumbnail'], use_container_width=True)
-                            st.divider()
-                    else:
-                        st.warning("No videos found or error occurred.")
-            else:
-                st.error("Please enter your YouTube API key in the sidebar.")
-    
-    with col2:
-        st.subheader("Last Month")
-        if st.button("Mine Last Month's Videos"):
-            if youtube_api_key:
-                with st.spinner("Fetching last month's popular videos..."):
-                    published_after = get_date_for_period("1 month")
-                    videos = get_popular_videos(youtube_api_key, search_query, max_results, published_after)
-                    
-                    if videos:
-                        # Add context to each video
-                        for video in videos:
-                            video['context'] = generate_video_context(video['title'], video['description'])
-                        
-                        # Store in session state for later use
-                        st.session_state['monthly_videos'] = videos
-                        
-                        # Display videos
-                        for i, video in enumerate(videos):
-                            st.write(f"**{i+1}. {video['title']}**")
-                            st.write(f"*Context: {video['context']}*")
-                            st.write(f"Views: {video['view_count']:,} | Channel: {video['channel']}")
-                            st.write(f"[Watch on YouTube](https://www.youtube.com/watch?v={video['video_id']})")
-                            st.image(video['thumbnail'], use_container_width=True)
-                            st.divider()
-                    else:
-                        st.warning("No videos found or error occurred.")
-            else:
-                st.error("Please enter your YouTube API key in the sidebar.")
-    
-    with col3:
-        st.subheader("Last 6 Months")
-        if st.button("Mine Last 6 Months' Videos"):
-            if youtube_api_key:
-                with st.spinner("Fetching last 6 months' popular videos..."):
-                    published_after = get_date_for_period("6 months")
-                    videos = get_popular_videos(youtube_api_key, search_query, max_results, published_after)
-                    
-                    if videos:
-                        # Add context to each video
-                        for video in videos:
-                            video['context'] = generate_video_context(video['title'], video['description'])
-                        
-                        # Store in session state for later use
-                        st.session_state['biannual_videos'] = videos
-                        
-                        # Display videos
-                        for i, video in enumerate(videos):
-                            st.write(f"**{i+1}. {video['title']}**")
-                            st.write(f"*Context: {video['context']}*")
-                            st.write(f"Views: {video['view_count']:,} | Channel: {video['channel']}")
-                            st.write(f"[Watch on YouTube](https://www.youtube.com/watch?v={video['video_id']})")
-                            st.image(video['thumbnail'], use_container_width=True)
-                            st.divider()
-                    else:
-                        st.warning("No videos found or error occurred.")
-            else:
-                st.error("Please enter your YouTube API key in the sidebar.")
+                    counts = ", ".join(
+                        f"{len(st.session_state[state_key])} from {source.lower()}"
+                        for source, state_key in TIME_PERIODS.values()
+                    )
+                    st.success(f"Mined videos: {counts}.")
+                else:
+                    st.warning("No videos found or error occurred.")
+        else:
+            st.error("Please enter your YouTube API key in the sidebar.")
+    
+    # One column per time period, each with its own mine button
+    for column, period in zip(st.columns(3), TIME_PERIODS):
+        with column:
+            mine_and_render_period(period, youtube_api_key, search_query, max_results, show_mined=mined_all)
 
 with tab2:
     st.header("Generate Lecture Themes by Age Group")
@@ -380,46 +512,27 @@ with tab2:
     else:
         st.warning("⚠️ No philosophical context loaded. Upload an HTML file in the sidebar to provide context.")
     
+    # Map each time period's source label to its session state key
+    data_mapping = dict(TIME_PERIODS.values())
+    
     # Select data source
     data_source = st.selectbox(
         "Select Video Data Source",
-        ["Last Week", "Last Month", "Last 6 Months", "Combined (All Time Periods)"]
+        list(data_mapping) + ["Combined (All Time Periods)"]
     )
     
-    # Map selection to session state keys
-    data_mapping = {
-        "Last Week": 'weekly_videos',
-        "Last Month": 'monthly_videos',
-        "Last 6 Months": 'biannual_videos'
-    }
-    
     # Get videos from selected source
     selected_videos = []
     if data_source in data_mapping:
         selected_videos = st.session_state.get(data_mapping[data_source], [])
     elif data_source == "Combined (All Time Periods)":
-        # Combine all video sources
-        weekly = st.session_state.get('weekly_videos', [])
-        monthly = st.session_state.get('monthly_videos', [])
-        biannual = st.session_state.get('biannual_videos', [])
-        
-        # Add source field to track which time period each video came from
-        for v in weekly:
-            v['source'] = 'Last Week'
-        for v in monthly:
-            v['source'] = 'Last Month'
-        for v in biannual:
-            v['source'] = 'Last 6 Months'
-        
-        # Combine and deduplicate by video ID
-        all_videos = weekly + monthly + biannual
-        video_ids_seen = set()
-        selected_videos = []
-        
-        for video in all_videos:
-            if video['video_id'] not in video_ids_seen:
-                selected_videos.append(video)
-                video_ids_seen.add(video['video_id'])
+        # Combine all time periods and deduplicate by video ID, keeping the first occurrence
+        # (each video was tagged with its source time period when mined)
+        combined_videos = {}
+        for state_key in data_mapping.values():
+            for video in st.session_state.get(state_key, []):
+                combined_videos.setdefault(video['video_id'], video)
+        selected_videos = list(combined_videos.values())
     
     # Show summary of available videos
     if selected_videos:
@@ -441,11 +554,17 @@ with tab2:
         ["20-30", "30-40", "40-50", "50-60", "60+"]
     )
     
+    # Skip cached answers when the user wants fresh suggestions for the same input
+    regenerate = st.checkbox(
+        "Regenerate fresh suggestions",
+        help="Ask Gemini again instead of reusing themes generated for the same videos and age group in the last 24 hours."
+    )
+    
     # Generate themes button
     if st.button("Generate Lecture Themes"):
         if gemini_api_key and selected_videos:
             with st.spinner(f"Generating lecture themes for {age_group} age group..."):
-                themes = generate_lecture_themes(gemini_api_key, selected_videos, age_group)
+                themes = generate_lecture_themes(gemini_api_key, selected_videos, age_group, use_cache=not regenerate)
                 st.markdown(themes)
         elif not gemini_api_key:
             st.error("Please enter your Google Gemini API key in the sidebar.")
@@ -473,8 +592,9 @@ with tab3:
     - Google Gemini API key
     
     ### Privacy
-    This application does not store any data outside your browser session. API keys are not saved 
-    between sessions for security reasons.
+    This application does not write any data to disk. To save API quota, mined video results are cached 
+    in the server's memory for up to an hour and generated lecture themes for up to 24 hours; these 
+    caches are cleared when the app restarts. API keys are not saved between sessions for security reasons.
     """)
 
 # Footer